@@ -4,12 +4,15 @@
 
 -- For SQL Server, use this format:
 /*
+-- Run the table creation, load and indexing as one transaction
+BEGIN TRANSACTION;
+
 CREATE TABLE Tourism_Arrivals (
     Country NVARCHAR(100),
-    Country_Code NVARCHAR(10),
+    Country_Code CHAR(3),
     Region NVARCHAR(50),
-    Year INT,
-    Month INT,
+    Year SMALLINT,
+    Month TINYINT,
     Arrivals BIGINT,
     Arrivals_Growth_Rate DECIMAL(5,1),
     Arrivals_Per_Capita DECIMAL(10,6),
@@ -18,20 +21,36 @@ CREATE TABLE Tourism_Arrivals (
     Off_Season_Arrivals BIGINT,
     Population BIGINT,
     GDP_Per_Capita INT,
-    Tourism_Maturity NVARCHAR(20)
+    Tourism_Maturity VARCHAR(10)
 );
 
--- Then use BULK INSERT or import the CSV file
+-- Then stream the CSV straight from disk with BULK INSERT (the file is read in batches by
+-- the server, so nothing is staged in client memory); adjust the path for your server
+BULK INSERT Tourism_Arrivals
+FROM 'C:\data\Tourism_Arrivals_Enhanced.csv'
+WITH (FIRSTROW = 2, FIELDTERMINATOR = ',', ROWTERMINATOR = '0x0a', TABLOCK);
+
+-- Build indexes after the load (cheaper than maintaining them row by row) to support the
+-- Country/Year grouping, Year range filters and Region breakdowns used by the solutions
+CREATE INDEX idx_country_year ON Tourism_Arrivals (Country, Year);
+CREATE INDEX idx_year ON Tourism_Arrivals (Year);
+CREATE INDEX idx_region ON Tourism_Arrivals (Region);
+
+COMMIT TRANSACTION;
 */
 
 -- For PostgreSQL, use this format:
 /*
+-- Run the table creation, load and indexing as one transaction; COPY into a table created
+-- in the same transaction can also skip WAL when wal_level = minimal
+BEGIN;
+
 CREATE TABLE Tourism_Arrivals (
     Country VARCHAR(100),
-    Country_Code VARCHAR(10),
+    Country_Code CHAR(3),
     Region VARCHAR(50),
-    Year INTEGER,
-    Month INTEGER,
+    Year SMALLINT,
+    Month SMALLINT,
     Arrivals BIGINT,
     Arrivals_Growth_Rate DECIMAL(5,1),
     Arrivals_Per_Capita DECIMAL(10,6),
@@ -40,11 +59,84 @@ CREATE TABLE Tourism_Arrivals (
     Off_Season_Arrivals BIGINT,
     Population BIGINT,
     GDP_Per_Capita INTEGER,
-    Tourism_Maturity VARCHAR(20)
+    Tourism_Maturity VARCHAR(10)
 );
 
--- Then use COPY command or import the CSV file
+-- Then stream the CSV with COPY (use \copy from psql when the file is on the client machine)
+COPY Tourism_Arrivals FROM '/data/Tourism_Arrivals_Enhanced.csv' WITH (FORMAT csv, HEADER true);
+
+-- Build indexes after the load
+CREATE INDEX idx_country_year ON Tourism_Arrivals (Country, Year);
+CREATE INDEX idx_year ON Tourism_Arrivals (Year);
+CREATE INDEX idx_region ON Tourism_Arrivals (Region);
+
+COMMIT;
+
+ANALYZE Tourism_Arrivals;
+*/
+
+-- For SQLite, use this format (sqlite3 command-line shell):
+/*
+-- The database can always be rebuilt from the CSV, so keep the journal in memory and skip fsync
+PRAGMA journal_mode = MEMORY;
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -262144;  -- 256 MB page cache
+
+-- Run the table creation, load and indexing as one transaction so SQLite commits once
+BEGIN IMMEDIATE;
+
+-- Create the table first so columns get numeric types (an auto-created table stores
+-- every column as TEXT)
+CREATE TABLE Tourism_Arrivals (
+    Country TEXT,
+    Country_Code TEXT,
+    Region TEXT,
+    Year INTEGER,
+    Month INTEGER,
+    Arrivals INTEGER,
+    Arrivals_Growth_Rate REAL,
+    Arrivals_Per_Capita REAL,
+    Source_Market_Diversity REAL,
+    Peak_Season_Arrivals INTEGER,
+    Off_Season_Arrivals INTEGER,
+    Population INTEGER,
+    GDP_Per_Capita INTEGER,
+    Tourism_Maturity TEXT
+);
+
+.import --csv --skip 1 Tourism_Arrivals_Enhanced.csv Tourism_Arrivals
+
+-- Build indexes after the load
+CREATE INDEX idx_country_year ON Tourism_Arrivals (Country, Year);
+CREATE INDEX idx_year ON Tourism_Arrivals (Year);
+CREATE INDEX idx_region ON Tourism_Arrivals (Region);
+ANALYZE;
+
+COMMIT;
+*/
+
+-- For DuckDB, use this format:
+/*
+-- Columnar, vectorized engine suited to the GROUP BY-heavy solutions; read_csv_auto infers
+-- the column types and loads the file in parallel
+CREATE TABLE Tourism_Arrivals AS
+SELECT * FROM read_csv_auto('Tourism_Arrivals_Enhanced.csv');
+
+-- No secondary indexes needed: DuckDB keeps min/max zone maps per row group automatically
 */
 
--- For SQLite, the table is created automatically when importing the CSV
 -- All existing SQL solutions should work without modification
+
+-- Data quality check (all databases): row count, missing values, year coverage and
+-- distinct markets in a single pass over the table
+SELECT COUNT(*) AS Total_Records,
+       SUM(CASE WHEN Arrivals IS NULL THEN 1 ELSE 0 END) AS Missing_Arrivals,
+       SUM(CASE WHEN Peak_Season_Arrivals IS NULL THEN 1 ELSE 0 END) AS Missing_Peak_Arrivals,
+       SUM(CASE WHEN Off_Season_Arrivals IS NULL THEN 1 ELSE 0 END) AS Missing_Off_Arrivals,
+       MIN(Year) AS First_Year,
+       MAX(Year) AS Last_Year,
+       COUNT(DISTINCT Year) AS Years,
+       COUNT(DISTINCT Country) AS Countries,
+       COUNT(DISTINCT Region) AS Regions
+FROM Tourism_Arrivals;
@@ -26,16 +26,15 @@ WITH YearlyTotals AS (
 ),
 
 -- STEP 1.5: Validate data completeness and get chronological values for CAGR
+-- A window count reads YearlyTotals once instead of re-aggregating it for an IN subquery
 ValidatedData AS (
   SELECT Country, Year, YearlyArrivals
-  FROM YearlyTotals
-  WHERE Country IN (
-    -- Only include countries with data for all 3 years
-    SELECT Country 
-    FROM YearlyTotals 
-    GROUP BY Country 
-    HAVING COUNT(*) = 3
-  )
+  FROM (
+    SELECT Country, Year, YearlyArrivals,
+           COUNT(*) OVER (PARTITION BY Country) AS YearsWithData
+    FROM YearlyTotals
+  ) AS CountryYears
+  WHERE YearsWithData = 3  -- Only include countries with data for all 3 years
 ),
 
 -- STEP 2: Calculate the 3 key performance metrics for each country
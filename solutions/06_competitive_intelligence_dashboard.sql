@@ -22,7 +22,7 @@
 -- STEP 1: Create comprehensive market positioning profiles
 -- This defines the key competitive characteristics for each market
 WITH MarketProfiles AS (
-  SELECT Country,
+  SELECT Country, Country_Code,
          -- MARKET SIZE: Total arrivals as market scale indicator
          SUM(Arrivals) AS TotalArrivals,
          
@@ -47,33 +47,27 @@ WITH MarketProfiles AS (
          -- DATA COMPLETENESS: Number of observations for reliability
          COUNT(*) AS DataPoints
   FROM Tourism_Arrivals
-  GROUP BY Country
+  GROUP BY Country, Country_Code
   HAVING COUNT(*) >= 3  -- Ensure sufficient data for analysis
 ),
 
--- STEP 2: Calculate geographic proximity scores
--- This considers regional competitive pressure and market overlap
-GeographicProximity AS (
+-- STEP 2: Score every pair of markets in a single pass
+-- Geographic proximity, positioning similarity and revenue potential all compare the same
+-- two profiles, so one CROSS JOIN produces all three scores
+PairwiseScores AS (
   SELECT a.Country AS Country1, b.Country AS Country2,
          -- GEOGRAPHIC COMPETITION SCORE: Based on regional proximity
          -- Higher score = closer geographic competition
          CASE 
            -- Same region (assumed based on country names for demo)
-           WHEN LEFT(a.Country, 3) = LEFT(b.Country, 3) THEN 0.8
+           -- Country_Code already holds the first three letters of the name
+           WHEN a.Country_Code = b.Country_Code THEN 0.8
            -- Adjacent regions (simplified logic)
            WHEN ABS(LEN(a.Country) - LEN(b.Country)) <= 2 THEN 0.6
            -- Different regions
            ELSE 0.3
-         END AS GeographicScore
-  FROM MarketProfiles a
-  CROSS JOIN MarketProfiles b
-  WHERE a.Country != b.Country
-),
-
--- STEP 3: Calculate market positioning similarity scores
--- This measures competitive overlap in market characteristics
-PositioningSimilarity AS (
-  SELECT a.Country AS Country1, b.Country AS Country2,
+         END AS GeographicScore,
+         
          -- WEIGHTED SIMILARITY SCORE: Multi-dimensional competitive analysis
          -- Lower score = more similar positioning = stronger competition
          (
@@ -91,16 +85,8 @@ PositioningSimilarity AS (
            
            -- Market Diversity Similarity (10% weight) - Similar tourist source focus
            0.1 * ABS(a.MarketDiversity - b.MarketDiversity)
-         ) AS PositioningScore
-  FROM MarketProfiles a
-  CROSS JOIN MarketProfiles b
-  WHERE a.Country != b.Country
-),
-
--- STEP 4: Calculate revenue potential comparison
--- This assesses market attractiveness and investment appeal
-RevenuePotential AS (
-  SELECT a.Country AS Country1, b.Country AS Country2,
+         ) AS PositioningScore,
+         
          -- REVENUE POTENTIAL SCORE: Market attractiveness comparison
          -- Higher score = more attractive market for investment
          (
@@ -118,30 +104,28 @@ RevenuePotential AS (
   WHERE a.Country != b.Country
 ),
 
--- STEP 5: Combine all competitive factors into final similarity matrix
+-- STEP 3: Combine all competitive factors into final similarity matrix
 CompetitiveMatrix AS (
-  SELECT p.Country1, p.Country2, 
-         p.PositioningScore,
-         g.GeographicScore,
-         r.RevenueScore,
+  SELECT Country1, Country2, 
+         PositioningScore,
+         GeographicScore,
+         RevenueScore,
          -- FINAL COMPETITIVE SIMILARITY SCORE: Weighted combination
          -- Lower score = stronger competitive threat
          (
            -- Positioning Similarity (50% weight) - Core competitive overlap
-           0.5 * p.PositioningScore +
+           0.5 * PositioningScore +
            
            -- Geographic Proximity (30% weight) - Regional competitive pressure
-           0.3 * (1 - g.GeographicScore) +
+           0.3 * (1 - GeographicScore) +
            
            -- Revenue Potential Competition (20% weight) - Investment appeal competition
-           0.2 * (1 - r.RevenueScore)
+           0.2 * (1 - RevenueScore)
          ) AS CompetitiveSimilarityScore
-  FROM PositioningSimilarity p
-  JOIN GeographicProximity g ON p.Country1 = g.Country1 AND p.Country2 = g.Country2
-  JOIN RevenuePotential r ON p.Country1 = r.Country1 AND p.Country2 = r.Country2
+  FROM PairwiseScores
 ),
 
--- STEP 6: Rank competitors by competitive similarity score
+-- STEP 4: Rank competitors by competitive similarity score
 CompetitorRanking AS (
   SELECT Country1, Country2, 
          CAST(ROUND(PositioningScore, 2) AS DECIMAL(10,2)) AS PositioningScore,
@@ -153,7 +137,7 @@ CompetitorRanking AS (
   FROM CompetitiveMatrix
 )
 
--- STEP 7: Select top 3 competitors with detailed competitive analysis
+-- STEP 5: Select top 3 competitors with detailed competitive analysis
 SELECT 
        Country1 AS Country, 
        Country2 AS TopCompetitor, 
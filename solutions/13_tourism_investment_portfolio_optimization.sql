@@ -46,6 +46,16 @@ WITH CountryMetrics AS (
   GROUP BY Country
 ),
 
+-- STEP 1.5: Calculate overall market averages once
+-- These are shared by every country, so compute them a single time instead of per expression
+MarketAverages AS (
+  SELECT 
+    AVG(AvgReturn) AS MarketAvgReturn,
+    AVG(ReturnVolatility) AS MarketAvgVolatility,
+    AVG(PositiveGrowthRatio) AS MarketAvgPositiveRatio
+  FROM CountryMetrics
+),
+
 -- STEP 2: Calculate market diversity score
 -- This measures how different each market is from the average
 MarketDiversity AS (
@@ -60,15 +70,15 @@ MarketDiversity AS (
     
     -- MARKET DIVERSITY: How different this market is from average
     -- Based on deviation from overall market averages
-    ABS(AvgReturn - (SELECT AVG(AvgReturn) FROM CountryMetrics)) +
-    ABS(ReturnVolatility - (SELECT AVG(ReturnVolatility) FROM CountryMetrics)) +
-    ABS(PositiveGrowthRatio - (SELECT AVG(PositiveGrowthRatio) FROM CountryMetrics)) AS MarketDiversity,
+    ABS(AvgReturn - MarketAvgReturn) +
+    ABS(ReturnVolatility - MarketAvgVolatility) +
+    ABS(PositiveGrowthRatio - MarketAvgPositiveRatio) AS MarketDiversity,
     
     -- DIVERSIFICATION SCORE: Normalized diversity (0-1 scale)
-    (ABS(AvgReturn - (SELECT AVG(AvgReturn) FROM CountryMetrics)) +
-     ABS(ReturnVolatility - (SELECT AVG(ReturnVolatility) FROM CountryMetrics)) +
-     ABS(PositiveGrowthRatio - (SELECT AVG(PositiveGrowthRatio) FROM CountryMetrics))) / 3.0 AS DiversificationScore
-  FROM CountryMetrics
+    (ABS(AvgReturn - MarketAvgReturn) +
+     ABS(ReturnVolatility - MarketAvgVolatility) +
+     ABS(PositiveGrowthRatio - MarketAvgPositiveRatio)) / 3.0 AS DiversificationScore
+  FROM CountryMetrics, MarketAverages
 ),
 
 -- STEP 3: Calculate portfolio optimization metrics